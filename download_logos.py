@@ -1,6 +1,7 @@
-import urllib.request
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httpx
 
 logos = {
     "twilio.png": "https://logo.clearbit.com/twilio.com?size=512",
@@ -29,33 +30,50 @@ os.makedirs(output_dir, exist_ok=True)
 
 headers = {'User-Agent': 'Mozilla/5.0'}
 
-for filename, url in logos.items():
+# One HTTP/2 client shared by all workers: requests to the same host are multiplexed
+# over a single TLS connection instead of opening one per download
+client = httpx.Client(http2=True, headers=headers, timeout=10, follow_redirects=True)
+
+
+def download(url):
+    response = client.get(url)
+    response.raise_for_status()
+    return response.content
+
+
+def fetch(filename, url):
+    """Download one logo (with fallback) and return the lines to report."""
     filepath = os.path.join(output_dir, filename)
-    print(f"Downloading {filename} from {url}...")
+    lines = [f"Downloading {filename} from {url}..."]
     try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req) as response:
-            data = response.read()
-            # Basic check if it's an image
-            if len(data) > 100: 
-                with open(filepath, 'wb') as f:
-                    f.write(data)
-                print(f"  ✓ Saved {filename} ({len(data)} bytes)")
-            else:
-                print(f"  ✗ Failed: content too small")
+        data = download(url)
+        # Basic check if it's an image
+        if len(data) > 100:
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            lines.append(f"  ✓ Saved {filename} ({len(data)} bytes)")
+        else:
+            lines.append(f"  ✗ Failed: content too small")
     except Exception as e:
-        print(f"  ✗ Failed: {e}")
+        lines.append(f"  ✗ Failed: {e}")
         # Try fallback
         if filename in fallbacks:
             fallback_url = fallbacks[filename]
-            print(f"  ↻ Trying fallback for {filename}: {fallback_url}")
+            lines.append(f"  ↻ Trying fallback for {filename}: {fallback_url}")
             try:
-                req = urllib.request.Request(fallback_url, headers=headers)
-                with urllib.request.urlopen(req) as response:
-                    data = response.read()
-                    with open(filepath, 'wb') as f:
-                        f.write(data)
-                print(f"  ✓ Saved fallback {filename} ({len(data)} bytes)")
+                data = download(fallback_url)
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+                lines.append(f"  ✓ Saved fallback {filename} ({len(data)} bytes)")
             except Exception as e2:
-                print(f"  ✗ Fallback failed: {e2}")
+                lines.append(f"  ✗ Fallback failed: {e2}")
+    return lines
+
+
+# Downloads are pure network I/O, so threads overlap the round trips
+with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = [executor.submit(fetch, filename, url) for filename, url in logos.items()]
+    for future in as_completed(futures):
+        print("\n".join(future.result()))
 
+client.close()